@@ -1,7 +1,20 @@
 """GitPlex - Seamlessly manage multiple Git identities and workspaces."""
 
-from gitplex.cli import cli, setup, switch, list
-from gitplex.profile import ProfileManager
+from typing import Any
+
+from gitplex.cli import cli
 from gitplex.version import __version__
 
 __all__ = ["ProfileManager", "__version__", "cli", "setup", "switch", "list"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ProfileManager and commands lazily so CLI startup doesn't load them."""
+    if name == "ProfileManager":
+        from gitplex.profile import ProfileManager
+        return ProfileManager
+    if name in ("setup", "switch", "list"):
+        # The name "cli" here is the group, so go through the module
+        import importlib
+        return getattr(importlib.import_module("gitplex.cli"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,8 @@
 """Backup and configuration management utilities."""
 
+import configparser
+import copy
+import functools
 import os
 import shutil
 import subprocess
@@ -20,6 +23,184 @@ BACKUP_DIR = GITPLEX_DIR / "backups"
 GIT_CONFIG = Path.home() / ".gitconfig"
 SSH_CONFIG = Path.home() / ".ssh" / "config"
 
+def _gitconfig_headers_supported(text: str) -> bool:
+    """Whether every section header in text can be read without git.
+    
+    Includes need git to resolve them; configparser misreads entries on the
+    header line (``[user] name = x``) and merges a DEFAULT section into every
+    other section.
+    """
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("["):
+            header, _, rest = stripped[1:].partition("]")
+            name = header.strip().partition(" ")[0].lower()
+            if rest.strip() or name in ("default", "include", "includeif"):
+                return False
+    return True
+
+def _gitconfig_value_supported(value: str) -> bool:
+    """Whether configparser read a value the way git does.
+    
+    Quoting and escapes are git syntax; deeper indented lines are
+    continuations to configparser; and a "#" or ";" without whitespace
+    before it is not a comment to configparser.
+    """
+    return not any(c in value for c in '"\\\n#;')
+
+def _parse_gitconfig(path: Path) -> dict[str, str] | None:
+    """Parse a Git config file directly, without spawning git.
+    
+    Args:
+        path: Path to the config file
+        
+    Returns:
+        Flattened config (e.g. ``{"user.name": ...}``), or None if the file
+        uses syntax only git can resolve (includes, quoting, escapes)
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    if not _gitconfig_headers_supported(text):
+        return None
+    
+    parser = configparser.ConfigParser(
+        strict=False,
+        interpolation=None,
+        allow_no_value=True,
+        inline_comment_prefixes=("#", ";"),
+    )
+    try:
+        parser.read_string(text, source=str(path))
+    except configparser.Error:
+        return None
+    
+    config = {}
+    for section in parser.sections():
+        name, _, subsection = section.partition(" ")
+        prefix = name
+        if subsection:
+            prefix += "." + subsection.strip().strip('"')
+        for key, value in parser.items(section, raw=True):
+            if value is None:
+                continue  # Implicit booleans are not listed with a value
+            if not _gitconfig_value_supported(value):
+                return None
+            config[f"{prefix}.{key}".lower()] = value.strip()
+    return config
+
+def _gitconfig_writable(path: Path, values: dict[str, str]) -> bool:
+    """Whether values can be written to a Git config file without git's help."""
+    for key, value in values.items():
+        if key.count(".") != 1 or value != value.strip():
+            return False
+        if any(c in value for c in '#;"\\\n'):
+            return False
+    return _parse_gitconfig(path) is not None
+
+def _replace_gitconfig_values(
+    lines: list[str], pending: dict[str, tuple[str, str]]
+) -> tuple[set[str], dict[str, int]]:
+    """Replace existing entries in place.
+    
+    Returns:
+        The keys that were replaced, and the index of each section's last line
+    """
+    written: set[str] = set()
+    section_end: dict[str, int] = {}
+    section = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("["):
+            section = stripped[1:stripped.find("]")].strip().lower()
+            section_end[section] = i
+            continue
+        if section is None or not stripped or stripped[0] in "#;":
+            continue
+        section_end[section] = i
+        name = stripped.split("=", 1)[0].strip()
+        full_key = f"{section}.{name.lower()}"
+        if full_key in pending:
+            indent = line[:len(line) - len(line.lstrip())]
+            lines[i] = f"{indent}{name} = {pending[full_key][1]}"
+            written.add(full_key)
+    return written, section_end
+
+def _insert_gitconfig_values(
+    lines: list[str], additions: dict[str, list[str]], section_end: dict[str, int]
+) -> None:
+    """Append entries to their sections, creating missing sections at the end."""
+    # Insert bottom-up so earlier section indices stay valid
+    for name in sorted(
+        (name for name in additions if name in section_end),
+        key=section_end.__getitem__,
+        reverse=True,
+    ):
+        at = section_end[name] + 1
+        lines[at:at] = additions[name]
+    for name, entries in additions.items():
+        if name not in section_end:
+            lines += [f"[{name}]", *entries]
+
+def _write_gitconfig(path: Path, values: dict[str, str]) -> bool:
+    """Set ``section.key`` values in a Git config file directly, without spawning git.
+    
+    Existing entries are replaced in place; new ones are appended to their
+    section, which is created at the end of the file if needed.
+    
+    Args:
+        path: Path to the config file
+        values: Values to set, keyed like ``"user.name"``
+        
+    Returns:
+        False, leaving the file untouched, if the file or a value needs syntax
+        only git can write (includes, quoting, escapes, subsections)
+    """
+    if not _gitconfig_writable(path, values):
+        return False
+    
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+    
+    pending = {key.lower(): (key, value) for key, value in values.items()}
+    written, section_end = _replace_gitconfig_values(lines, pending)
+    
+    additions: dict[str, list[str]] = {}
+    for full_key, (key, value) in pending.items():
+        if full_key not in written:
+            name = key.split(".", 1)[1]
+            additions.setdefault(full_key.split(".", 1)[0], []).append(f"\t{name} = {value}")
+    _insert_gitconfig_values(lines, additions, section_end)
+    
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return True
+
+def _global_config_redirected() -> bool:
+    """Whether ``git config --global`` reads more than ``~/.gitconfig``."""
+    if "GIT_CONFIG_GLOBAL" in os.environ:
+        return True
+    xdg_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return (Path(xdg_home) / "git" / "config").exists()
+
+def _git_config_list(git_args: list[str]) -> dict[str, str]:
+    """Read a Git config through ``git config --list``."""
+    output = subprocess.check_output(["git", "config", *git_args, "--list", "-z"]).decode()
+    
+    # NUL-terminated "key\nvalue" entries; unlike "key=value" lines this
+    # survives values containing "=" or newlines
+    config = {}
+    for entry in output.split("\0"):
+        key, sep, value = entry.partition("\n")
+        if sep:
+            config[key.lower()] = value.strip()
+    return config
+
 def get_git_config(profile: str | None = None) -> dict[str, str]:
     """Get Git configuration."""
     try:
@@ -31,24 +212,22 @@ def get_git_config(profile: str | None = None) -> dict[str, str]:
             config_file = profile_dir / ".gitconfig"
             if not config_file.exists():
                 return {}
-            output = subprocess.check_output(
-                ["git", "config", "--file", str(config_file), "--list"]
-            ).decode()
+            git_args = ["--file", str(config_file)]
         else:
             # Get global config
-            global_config = Path.home() / ".gitconfig"
-            if not global_config.exists():
+            config_file = Path.home() / ".gitconfig"
+            if not config_file.exists():
                 # Create empty .gitconfig if it doesn't exist
-                global_config.touch(mode=0o644)
-            output = subprocess.check_output(["git", "config", "--global", "--list"]).decode()
+                config_file.touch(mode=0o644)
+            git_args = ["--global"]
         
-        # Parse config output into dictionary
-        config = {}
-        for line in output.splitlines():
-            if "=" in line:
-                key, value = line.split("=", 1)
-                config[key.strip().lower()] = value.strip()
-        return config
+        # Read the file directly; only fall back to git for syntax we can't
+        # handle, or when git would read the global config from elsewhere
+        if not profile and _global_config_redirected():
+            config = None
+        else:
+            config = _parse_gitconfig(config_file)
+        return config if config is not None else _git_config_list(git_args)
     except subprocess.CalledProcessError as e:
         if profile:
             logger.warning(f"Failed to get Git config for profile {profile}: {e}")
@@ -108,9 +287,21 @@ def parse_ssh_key(key_file: Path) -> SSHKey | None:
         logger.warning(f"Failed to parse SSH key {key_file}: {e}")
         return None
 
+def _mtime_ns(path: Path) -> int | None:
+    """Get modification time of a path, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def check_existing_configs() -> dict:
     """Check for existing Git and SSH configurations.
     
+    The scan is cached for the lifetime of the process and invalidated when
+    ~/.ssh, ~/.ssh/config or ~/.gitconfig change on disk. Call
+    ``clear_config_cache()`` after writing configurations. Each call returns
+    its own copy, so callers may modify it.
+    
     Returns:
         dict: Dictionary containing information about existing configurations:
         {
@@ -122,10 +313,25 @@ def check_existing_configs() -> dict:
             "ssh": {
                 "exists": bool,
                 "keys": list[SSHKey],
+                "by_provider": dict[str, SSHKey],  # first key found per provider
                 "providers": list[str]
             }
         }
     """
+    ssh_dir = Path.home() / ".ssh"
+    return copy.deepcopy(_scan_existing_configs(
+        _mtime_ns(ssh_dir),
+        _mtime_ns(ssh_dir / "config"),
+        _mtime_ns(Path.home() / ".gitconfig"),
+    ))
+
+def clear_config_cache() -> None:
+    """Drop the cached scan behind ``check_existing_configs()``."""
+    _scan_existing_configs.cache_clear()
+
+@functools.lru_cache(maxsize=1)
+def _scan_existing_configs(*mtimes: int | None) -> dict:
+    """Scan existing configurations; ``mtimes`` only serve as the cache key."""
     result = {
         "git": {
             "exists": False,
@@ -135,6 +341,7 @@ def check_existing_configs() -> dict:
         "ssh": {
             "exists": False,
             "keys": [],
+            "by_provider": {},
             "providers": []
         }
     }
@@ -143,48 +350,56 @@ def check_existing_configs() -> dict:
     git_config = Path.home() / ".gitconfig"
     if git_config.exists():
         result["git"]["exists"] = True
-        try:
-            # Parse git config
-            config = {}
-            output = subprocess.check_output(["git", "config", "--global", "--list"]).decode()
-            for line in output.splitlines():
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    config[key.strip()] = value.strip()
-            result["git"]["config"] = config
-            
-            # Check for provider configurations
-            providers = []
-            if "github.user" in config:
-                providers.append("github")
-            if "gitlab.user" in config:
-                providers.append("gitlab")
-            result["git"]["providers"] = providers
-        except subprocess.CalledProcessError:
-            pass
+        # Same reader as everywhere else: parsed in-process, git only as a fallback
+        config = get_git_config()
+        result["git"]["config"] = config
+        
+        # Check for provider configurations
+        providers = []
+        if "github.user" in config:
+            providers.append("github")
+        if "gitlab.user" in config:
+            providers.append("gitlab")
+        result["git"]["providers"] = providers
     
     # Check SSH configuration
     ssh_dir = Path.home() / ".ssh"
-    if ssh_dir.exists():
+    try:
+        # A single directory read; entry types come from the listing, not extra stats
+        with os.scandir(ssh_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = None
+    
+    if entries is not None:
         # Look for SSH keys
         keys = []
+        by_provider: dict[str, SSHKey] = {}
         providers = set()
         
-        for key_file in ssh_dir.glob("id_*"):
-            if key_file.suffix not in [".pub"]:  # Only process private keys
-                if key := parse_ssh_key(key_file):
+        for name, entry in entries.items():
+            # Only private keys with a public key next to them can be parsed
+            if (
+                name.startswith("id_")
+                and not name.endswith(".pub")
+                and f"{name}.pub" in entries
+                and entry.is_file()
+            ):
+                if key := parse_ssh_key(Path(entry.path)):
                     keys.append(key)
+                    by_provider.setdefault(key.provider, key)
                     if key.provider != "unknown":
                         providers.add(key.provider)
         
         if keys:
             result["ssh"]["exists"] = True
             result["ssh"]["keys"] = keys
+            result["ssh"]["by_provider"] = by_provider
             result["ssh"]["providers"] = list(providers)
         
         # Check SSH config file
-        ssh_config = ssh_dir / "config"
-        if ssh_config.exists():
+        if "config" in entries:
+            ssh_config = ssh_dir / "config"
             result["ssh"]["exists"] = True
             try:
                 with ssh_config.open() as f:
@@ -0,0 +1,67 @@
+"""Command-line interface."""
+
+import importlib
+import logging
+from typing import Any
+
+import click
+
+# Logging is configured when the CLI runs, not on import
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+logger = logging.getLogger(__name__)
+
+# Command name -> (module in this package, attribute). The modules carry a
+# _cmd suffix so importing one never shadows the command name on this package.
+_SUBCOMMANDS = {
+    "clone": ("clone_cmd", "clone"),
+    "delete": ("delete_cmd", "delete"),
+    "keys": ("keys_cmd", "keys"),
+    "list": ("list_cmd", "list_profiles"),
+    "restore": ("restore_cmd", "restore"),
+    "setup": ("setup_cmd", "setup"),
+    "switch": ("switch_cmd", "switch"),
+    "update": ("update_cmd", "update"),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module on first use."""
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommand names without importing anything."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing its module the first time it is asked for."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+            # Registered commands are found by the lookup above next time
+            self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_SUBCOMMANDS)
+@click.option('--debug', is_flag=True, help='Enable debug logging')
+def cli(debug: bool) -> None:
+    """Git profile manager."""
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+        logger.debug("Debug mode enabled")
+
+    logger.debug("Starting GitPlex CLI")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve commands by name, e.g. ``from gitplex.cli import setup``."""
+    if name in _SUBCOMMANDS:
+        return cli.get_command(click.Context(cli), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
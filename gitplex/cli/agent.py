@@ -0,0 +1,209 @@
+"""SSH agent helpers used by the CLI commands."""
+
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import GitplexError
+from ..ui_common import print_error, print_info, print_success, print_warning
+from .common import _agent_list
+
+
+def ensure_ssh_agent_running() -> None:
+    """Ensure SSH agent is running and properly configured."""
+    from ..system_utils import get_ssh_agent
+    
+    agent = get_ssh_agent()
+    if not agent.start():
+        raise GitplexError("SSH agent is required for GitPlex to function properly")
+
+def _private_keys(ssh_dir: Path, pattern: str = "id_*") -> Iterator[Path]:
+    """Yield the private key files in ssh_dir whose names match pattern."""
+    from fnmatch import fnmatch
+    
+    try:
+        with os.scandir(ssh_dir) as it:
+            for entry in it:
+                if (
+                    fnmatch(entry.name, pattern)
+                    and not entry.name.endswith(".pub")
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+_fingerprint_lock = threading.Lock()
+
+@cache
+def _fingerprint_cache() -> dict[str, Any]:
+    """Load the on-disk fingerprint cache, mapping key paths to [mtime_ns, fingerprint]."""
+    import json
+    
+    try:
+        return json.loads((Path.home() / ".gitplex" / "cache" / "fingerprints.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _public_key_fingerprint(pub_file: Path) -> str | None:
+    """Compute the SHA256 fingerprint of a public key file, as ssh-keygen -l prints it."""
+    import base64
+    import hashlib
+    
+    try:
+        blob = base64.b64decode(pub_file.read_text().split()[1], validate=True)
+    except (OSError, IndexError, ValueError):
+        return None
+    return "SHA256:" + base64.b64encode(hashlib.sha256(blob).digest()).decode().rstrip("=")
+
+def _agent_fingerprints(listing: str) -> set[str]:
+    """Extract the key fingerprints from ``ssh-add -l`` output."""
+    return {fields[1] for fields in map(str.split, listing.splitlines()) if len(fields) > 1}
+
+def _key_fingerprint(key_file: Path) -> str | None:
+    """Get the fingerprint of an SSH key, or None if it can't be read.
+    
+    The fingerprint is hashed from the public key next to it when there is
+    one; otherwise ssh-keygen is asked, and its answers are cached on disk
+    until the key file changes.
+    """
+    import json
+    
+    fingerprint = _public_key_fingerprint(key_file.with_name(key_file.name + ".pub"))
+    if fingerprint:
+        return fingerprint
+    
+    try:
+        mtime = os.stat(key_file).st_mtime_ns
+    except OSError:
+        return None
+    
+    fingerprints = _fingerprint_cache()
+    cached = fingerprints.get(str(key_file))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        fingerprint = subprocess.check_output(
+            ["ssh-keygen", "-lf", str(key_file)],
+            text=True
+        ).split()[1]
+    except subprocess.CalledProcessError:
+        return None
+    
+    # Keys may be fingerprinted from several threads; write the file atomically
+    with _fingerprint_lock:
+        fingerprints[str(key_file)] = [mtime, fingerprint]
+        cache_file = Path.home() / ".gitplex" / "cache" / "fingerprints.json"
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(fingerprints))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    return fingerprint
+
+# Appended to the user's shell RC file to start the agent and load keys on login
+_SHELL_RC_BLOCK = """
+# Added by GitPlex - SSH agent configuration
+# Start SSH agent if not running
+if [ -z "$SSH_AUTH_SOCK" ]; then
+    eval `ssh-agent -s` > /dev/null 2>&1
+fi
+
+# Add SSH keys if not already added
+find ~/.ssh -type f -name "id_*" ! -name "*.pub" | while read key; do
+    if ! ssh-add -l | grep -q "$(ssh-keygen -lf "$key" | awk '{print $2}')"; then
+        ssh-add "$key" > /dev/null 2>&1
+    fi
+done
+"""
+# Any existing agent setup in the RC file, ours or the user's
+_SHELL_RC_AGENT_RE = re.compile(r"eval `ssh-agent -s`|ssh-add")
+
+def configure_ssh_agent_persistence() -> None:
+    """Configure SSH agent to start automatically and persist keys."""
+    from ..system_utils import parse_agent_env
+    
+    # 1. Start SSH agent now if not running; without a socket there is
+    # nothing to probe, so skip spawning ssh-add altogether
+    if not os.environ.get("SSH_AUTH_SOCK") or _agent_list() is None:
+        try:
+            # Start agent and capture its environment
+            agent_output = subprocess.check_output(
+                ["ssh-agent", "-s"],
+                text=True
+            )
+            
+            # Parse and export SSH agent environment variables
+            env = parse_agent_env(agent_output)
+            os.environ.update(env)
+            # Also export to parent shell
+            print("\n".join(f"export {var}={value}" for var, value in env.items()))
+        except subprocess.CalledProcessError as e:
+            print_error(f"Failed to start SSH agent: {e}")
+            return
+        _agent_list.cache_clear()
+    
+    # 2. Add all SSH keys to agent now
+    from concurrent.futures import ThreadPoolExecutor
+    
+    ssh_dir = Path.home() / ".ssh"
+    
+    # Snapshot the agent once (reusing the probe above), while the key
+    # fingerprints are computed alongside it
+    key_files = [*_private_keys(ssh_dir)]
+    with ThreadPoolExecutor() as executor:
+        agent_future = executor.submit(_agent_list)
+        fingerprints = [*executor.map(_key_fingerprint, key_files)]
+        agent_keys = _agent_fingerprints(agent_future.result() or "")
+    
+    to_add: dict[Path, str] = {}
+    for key_file, key_fingerprint in zip(key_files, fingerprints, strict=True):
+        if key_fingerprint is None:
+            print_warning(f"Failed to add key {key_file} to SSH agent")
+        elif key_fingerprint not in agent_keys:
+            to_add[key_file] = key_fingerprint
+    
+    # Load every missing key with a single ssh-add call, then check which made it
+    if to_add:
+        subprocess.run(["ssh-add", *map(str, to_add)], check=False)
+        _agent_list.cache_clear()
+        agent_keys = _agent_fingerprints(_agent_list() or "")
+        added = []
+        for key_file, key_fingerprint in to_add.items():
+            if key_fingerprint in agent_keys:
+                added.append(key_file)
+            else:
+                print_warning(f"Failed to add key {key_file} to SSH agent")
+        if added:
+            print_success(f"✓ Added {len(added)} key(s) to SSH agent: {', '.join(map(str, added))}")
+    else:
+        print_info("All keys are already loaded in the SSH agent")
+    
+    # 3. Configure persistence in shell RC file
+    shell_rc = None
+    shell = os.environ.get("SHELL", "")
+    
+    if "zsh" in shell:
+        shell_rc = Path.home() / ".zshrc"
+    elif "bash" in shell:
+        shell_rc = Path.home() / ".bashrc"
+    
+    if shell_rc:
+        # Scan line by line, stopping at the first existing agent setup, and
+        # append through the same handle when there is none
+        with shell_rc.open("a+") as f:
+            f.seek(0)
+            configured = any(_SHELL_RC_AGENT_RE.search(line) for line in f)
+            if not configured:
+                f.write(_SHELL_RC_BLOCK)
+        if not configured:
+            print_success("✓ Configured SSH agent to start automatically")
+            print_info("Please restart your terminal or run: source " + str(shell_rc))
@@ -0,0 +1,122 @@
+"""Repository clone command."""
+
+import re
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+import click
+
+from ..exceptions import GitplexError
+from ..ui_common import print_error, print_info, print_success, print_warning
+from .agent import (
+    _agent_fingerprints,
+    _key_fingerprint,
+    _private_keys,
+    configure_ssh_agent_persistence,
+)
+from .common import _agent_list, _run_git, handle_errors
+
+# URL schemes that clone rewrites to their SSH equivalent
+_HTTPS_PREFIXES = ("https://",)
+# [scheme://][user@]host followed by ":" or "/"; covers scp-style git@host:path too
+_CLONE_URL_RE = re.compile(r"(?:[a-z][a-z0-9+.-]*://)?(?:[^@/]+@)?([^@/:]+)[:/]", re.I)
+
+@lru_cache(maxsize=256)
+def verify_clone_url(url: str) -> tuple[bool, str]:
+    """Verify if a Git clone URL is using the correct protocol."""
+    if url.startswith(_HTTPS_PREFIXES):
+        host, _, path = url.partition("://")[2].partition("/")
+        return False, f"git@{host}:{path}"
+    return True, url
+
+def _find_provider_key(provider: str) -> Path | None:
+    """Find the provider's private key in a single scan of the SSH directory."""
+    from ..ssh import SSH_DIR
+    
+    return next(_private_keys(SSH_DIR, f"*{provider}*"), None)
+
+def _ensure_agent_ready(key_path: Path) -> bool:
+    """Make sure an SSH key is loaded in a running agent.
+    
+    Args:
+        key_path: Path to the private key that should be loaded
+        
+    Returns:
+        Whether the key is now loaded
+    """
+    from ..system_utils import get_ssh_agent
+    
+    agent_keys = _agent_list()
+    
+    # Happy path: the agent is up and already holds the key
+    if agent_keys is not None:
+        fingerprint = _key_fingerprint(key_path)
+        if fingerprint and fingerprint in _agent_fingerprints(agent_keys):
+            return True
+    elif not get_ssh_agent().start():
+        print_error("Failed to start SSH agent")
+        return False
+    
+    try:
+        subprocess.run(["ssh-add", key_path], check=True)
+        print_success(f"✓ Added key {key_path} to SSH agent")
+        return True
+    except subprocess.CalledProcessError as e:
+        print_error(f"Failed to add key {key_path} to SSH agent: {e}")
+        return False
+    finally:
+        _agent_list.cache_clear()
+
+@click.command()
+@click.argument("url")
+@click.option("--directory", help="Directory to clone into")
+@handle_errors
+def clone(url: str, directory: str | None = None) -> None:
+    """Clone a repository using the correct SSH configuration."""
+    # Verify URL protocol
+    is_ssh, correct_url = verify_clone_url(url)
+    if not is_ssh:
+        print_warning("HTTPS URL detected. Converting to SSH URL...")
+        print_info(f"Original URL: {url}")
+        print_info(f"SSH URL: {correct_url}")
+        url = correct_url
+    
+    # Extract provider from the URL's host in a single match
+    from ..ssh import HOSTNAME_PROVIDERS, PROVIDER_KEY_SETTINGS
+    
+    match = _CLONE_URL_RE.match(url)
+    host = match[1].lower() if match else ""
+    provider = HOSTNAME_PROVIDERS.get(host)
+    
+    if not provider:
+        raise GitplexError("Could not determine Git provider from URL")
+    
+    # Locate the provider key once and reuse it for the agent and for git
+    key_path = _find_provider_key(provider)
+    if key_path is None:
+        raise GitplexError(f"No SSH key found for provider: {provider}")
+    
+    # Make sure the key is loaded; a no-op when it already is. With a usable
+    # agent, load the other keys and keep the agent running across logins
+    if _ensure_agent_ready(key_path):
+        configure_ssh_agent_persistence()
+    
+    # Try to clone
+    try:
+        args = ["clone", url]
+        if directory:
+            args.append(directory)
+        
+        # Use GIT_SSH_COMMAND to force SSH to use the correct key
+        _run_git(args, env={"GIT_SSH_COMMAND": f"ssh -i {key_path}"})
+        print_success("✓ Repository cloned successfully")
+    except subprocess.CalledProcessError as e:
+        print_error("Failed to clone repository")
+        print_info("\nTroubleshooting steps:")
+        print_info("1. Run: ssh -vT git@" + host)
+        print_info("2. Check if your SSH key is added to " + provider.title() + ":")
+        print_info("   " + PROVIDER_KEY_SETTINGS[provider])
+        print_info("3. Try running: eval `ssh-agent -s` && ssh-add")
+        print_info(f"4. Run: gitplex keys diagnose {provider} --fix")
+        raise click.Abort()
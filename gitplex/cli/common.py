@@ -0,0 +1,123 @@
+"""Helpers shared by the CLI commands."""
+
+import logging
+import os
+import subprocess
+from collections.abc import Callable
+from functools import cache, lru_cache, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import click
+
+from ..exceptions import GitplexError, ProfileError, SystemConfigError
+from ..ui_common import console
+
+if TYPE_CHECKING:
+    from ..profile import ProfileManager
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+@cache
+def _pm() -> "ProfileManager":
+    """Get the profile manager, loading profiles on first use."""
+    from ..profile import ProfileManager
+    return ProfileManager()
+
+@lru_cache(maxsize=1)
+def _agent_list() -> str | None:
+    """List the keys loaded in the SSH agent, or None if it is unreachable.
+
+    The result is cached; call ``_agent_list.cache_clear()`` after adding keys
+    or starting an agent.
+    """
+    try:
+        result = subprocess.run(
+            ["ssh-add", "-l"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        return None
+    # Exit code 1 only means the agent holds no keys; 2 means no agent
+    if result.returncode == 2:
+        return None
+    return result.stdout
+
+# Applied on top of os.environ for every git call: untranslated output and
+# no credential prompts hanging a non-interactive run
+_GIT_ENV = {"LC_ALL": "C", "GIT_TERMINAL_PROMPT": "0"}
+
+def _run_git(
+    args: list[str], env: dict[str, str] | None = None, **kwargs: Any
+) -> subprocess.CompletedProcess[str]:
+    """Run a git command, raising CalledProcessError if it fails.
+    
+    Args:
+        args: Arguments passed to git
+        env: Extra environment variables for this call
+        **kwargs: Passed through to subprocess.run
+    """
+    return subprocess.run(
+        ["git", *args],
+        env={**os.environ, **_GIT_ENV, **(env or {})},
+        check=True,
+        text=True,
+        **kwargs,
+    )
+
+def _echo_error(label: str, message: str) -> None:
+    """Write an error line to stderr; plain text needs no Rich rendering."""
+    click.echo(f"\n{click.style(label, fg='red', bold=True)} {message}", err=True)
+
+def handle_errors(f: F) -> F:
+    """Decorator to handle errors in CLI commands."""
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return f(*args, **kwargs)
+        except ProfileError as e:
+            # Handle profile-specific errors
+            msg = str(e)
+            if "already exists" in msg:
+                console.print("\n[bold red]Error:[/bold red] " + msg)
+                
+                if e.current_config:
+                    console.print("\n[bold cyan]Current configuration:[/bold cyan]")
+                    for key, value in e.current_config.items():
+                        console.print(f"• {key}: {value}")
+                
+                console.print("\n[bold cyan]Options:[/bold cyan]")
+                console.print("1. Use a different name for your new profile")
+                if e.profile_name:
+                    console.print(f"2. Delete the existing profile: [yellow]gitplex delete {e.profile_name}[/yellow]")
+                    console.print(f"3. Use --force to overwrite: [yellow]gitplex setup {e.profile_name} --force[/yellow]")
+            else:
+                _echo_error("Error:", msg)
+            
+            raise click.Abort()
+            
+        except (GitplexError, SystemConfigError) as e:
+            _echo_error("Error:", str(e))
+            if e.details:
+                click.secho(e.details, dim=True, err=True)
+            raise click.Abort()
+            
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+            _echo_error("Unexpected error:", str(e))
+            raise click.Abort()
+    return cast(F, wrapper)
+
+def ensure_directory(path: str) -> str:
+    """Ensure directory exists and return absolute path."""
+    try:
+        dir_path = Path(os.path.abspath(path))
+        dir_path.mkdir(parents=True, exist_ok=True)
+        return str(dir_path)
+    except Exception as e:
+        msg = f"Failed to create directory {path}: {str(e)}"
+        raise SystemConfigError(msg) from e
@@ -0,0 +1,22 @@
+"""Profile delete command."""
+
+import click
+
+from ..ui_common import confirm_action, print_info, print_success
+from .common import _pm, handle_errors
+
+
+@click.command()
+@click.argument("name")
+@click.option("--force", is_flag=True, help="Force delete without confirmation")
+@handle_errors
+def delete(name: str, force: bool = False) -> None:
+    """Delete a Git profile."""
+    if not force and not confirm_action(
+        f"Are you sure you want to delete profile '{name}'?"
+    ):
+        print_info("Operation cancelled")
+        return
+
+    _pm().delete_profile(name, keep_files=False)
+    print_success(f"Profile '{name}' deleted successfully")
@@ -0,0 +1,450 @@
+"""SSH and Git configuration diagnostics."""
+
+import os
+import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.prompt import Prompt
+from rich.text import Text
+
+from ..exceptions import GitplexError, ProfileError
+from ..ui_common import console, print_error, print_info, print_success
+from .agent import _agent_fingerprints, _key_fingerprint
+from .common import _agent_list, _run_git
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from ..ssh import SSHKey
+
+@dataclass(slots=True)
+class FixPlan:
+    """Issues found by run_diagnostic, grouped by the fix that addresses them."""
+    # (mode, path) pairs
+    chmod: list[tuple[int, Path]] = field(default_factory=list)
+    regenerate_keys: bool = False
+    update_ssh_config: bool = False
+    # No automatic fix; reported until the user creates the file
+    create_ssh_config: bool = False
+    add_to_agent: Path | None = None
+    start_agent: bool = False
+    # Git settings to prompt for, mapped to the profile to write them to (None = global)
+    git_config: dict[str, str | None] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Whether any issue was recorded."""
+        return bool(
+            self.chmod
+            or self.regenerate_keys
+            or self.update_ssh_config
+            or self.create_ssh_config
+            or self.add_to_agent
+            or self.start_agent
+            or self.git_config
+        )
+    
+    def has_ssh_fixes(self) -> bool:
+        """Whether any recorded issue has an automatic SSH-side fix."""
+        return bool(
+            self.chmod
+            or self.start_agent
+            or self.add_to_agent
+            or self.regenerate_keys
+            or self.update_ssh_config
+        )
+
+# Status cells for the diagnostic tables, styled up front so no markup is parsed per row
+_OK = Text("✓", style="green")
+_WARN = Text("!", style="yellow")
+_FAIL = Text("✗", style="red")
+
+def _find_ssh_key(provider: str) -> "SSHKey | None":
+    """Find the provider's key in the (cached) existing-config scan.
+    
+    Prints an error and returns None when there is no such key.
+    """
+    from ..backup import check_existing_configs
+    
+    existing_configs = check_existing_configs()
+    if not existing_configs["ssh"]["exists"]:
+        print_error("No SSH keys found")
+        return None
+    
+    provider_key = existing_configs["ssh"]["by_provider"].get(provider.lower())
+    if not provider_key:
+        print_error(f"No SSH key found for provider: {provider}")
+    return provider_key
+
+def _safe_stat(path: Path) -> os.stat_result | None:
+    """Stat a path in a single syscall, returning None if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def _file_mentions(path: Path, needle: str) -> bool | None:
+    """Scan a file line by line for needle, returning None if it doesn't exist."""
+    try:
+        with path.open() as f:
+            return any(needle in line for line in f)
+    except FileNotFoundError:
+        return None
+
+def _make_status_table() -> "Table":
+    """Create an empty Check/Status/Details table for the diagnostic reports."""
+    from rich import box
+    from rich.table import Table
+    
+    table = Table(box=box.ROUNDED, show_header=True, border_style="blue")
+    table.add_column("Check", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Details", style="white")
+    return table
+
+def _check_git_config(profile: str | None, issues: FixPlan) -> None:
+    """Print the Git configuration report and record missing settings in issues."""
+    from ..backup import get_git_config
+    
+    console.print("\n[bold cyan]🔧 Git Configuration Report[/bold cyan]")
+    git_table = _make_status_table()
+    
+    # Get Git configs
+    global_git_config = get_git_config()
+    profile_git_config = get_git_config(profile) if profile else {}
+    
+    # Check user.name and user.email, preferring the profile's value
+    for key in ("user.name", "user.email"):
+        if profile and key in profile_git_config:
+            source, value = profile, profile_git_config[key]
+        elif key in global_git_config:
+            source, value = "global", global_git_config[key]
+        else:
+            git_table.add_row(key, _FAIL, "Not configured")
+            issues.git_config[key] = profile
+            continue
+        git_table.add_row(f"{key} ({source})", _OK, f"Set to: {value}")
+    
+    console.print(git_table)
+
+def run_diagnostic(
+    provider: str,
+    profile: str | None = None,
+    fix: bool = False,
+    verbose: bool = False,
+    test_connection: bool = False,
+) -> FixPlan:
+    """Run diagnostic checks and optionally fix issues.
+    
+    The connection is only tested again after fixing when test_connection is set.
+    
+    Returns:
+        The issues found, or those still present after fixing
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    from ..ssh import SSH_DIR, SSH_MULTIPLEX_OPTS
+    from ..system_utils import get_ssh_agent
+    from .setup_cmd import setup
+    
+    provider_key = _find_ssh_key(provider)
+    if not provider_key:
+        return FixPlan()
+    
+    # Start the connection test now so its network round-trip overlaps the local checks
+    executor = ThreadPoolExecutor(max_workers=1)
+    connection = executor.submit(
+        subprocess.run,
+        ["ssh", "-T", *SSH_MULTIPLEX_OPTS, f"git@{get_provider_hostname(provider)}"],
+        capture_output=True,
+    )
+    executor.shutdown(wait=False)
+    
+    console.print("\n[bold cyan]🔍 SSH Diagnostic Report[/bold cyan]")
+    
+    # Record issues directly by the fix that addresses them
+    issues = FixPlan()
+    
+    # Collect (check, status, details) rows; the table is built once all checks are done
+    rows: list[tuple[str, Text, str]] = []
+    
+    # Check key files from parallel arrays of label, path and expected mode
+    key_labels = ("Private Key", "Public Key")
+    key_paths = (provider_key.private_key, provider_key.public_key)
+    key_stats = [_safe_stat(p) for p in key_paths]
+    key_modes = [st.st_mode & 0o777 if st else None for st in key_stats]
+    expected_modes = (0o600, 0o644)
+    
+    for label, path, mode, expected in zip(
+        key_labels, key_paths, key_modes, expected_modes, strict=True
+    ):
+        if mode is None:
+            rows.append((label, _FAIL, f"Not found at {path}"))
+            issues.regenerate_keys = True
+        elif mode == expected:
+            rows.append((
+                label,
+                _OK,
+                f"Found at {path} with correct permissions ({expected:o})"
+            ))
+        else:
+            rows.append((
+                label,
+                _WARN,
+                f"Found but has wrong permissions: {mode:o} (should be {expected:o})"
+            ))
+            issues.chmod.append((expected, path))
+    
+    # Check SSH config
+    key_configured = _file_mentions(SSH_DIR / "config", str(provider_key.private_key))
+    if key_configured is None:
+        rows.append((
+            "SSH Config",
+            _FAIL,
+            "SSH config file not found"
+        ))
+        issues.create_ssh_config = True
+    elif key_configured:
+        rows.append((
+            "SSH Config",
+            _OK,
+            "Key is properly configured in SSH config"
+        ))
+    else:
+        rows.append((
+            "SSH Config",
+            _WARN,
+            "Key not found in SSH config"
+        ))
+        issues.update_ssh_config = True
+    
+    # Check SSH agent
+    agent_output = _agent_list()
+    if agent_output is None:
+        rows.append((
+            "SSH Agent",
+            _FAIL,
+            "SSH agent not running"
+        ))
+        issues.start_agent = True
+        issues.add_to_agent = provider_key.private_key
+    elif _key_fingerprint(provider_key.private_key) in _agent_fingerprints(agent_output):
+        rows.append((
+            "SSH Agent",
+            _OK,
+            "Key is loaded in SSH agent"
+        ))
+    else:
+        rows.append((
+            "SSH Agent",
+            _WARN,
+            "Key not loaded in SSH agent"
+        ))
+        issues.add_to_agent = provider_key.private_key
+    
+    # Test connection (stderr stays bytes; it is only decoded for the failure row)
+    result = connection.result()
+    if b"successfully authenticated" in result.stderr.lower():
+        rows.append((
+            "Connection Test",
+            _OK,
+            "Successfully authenticated with provider"
+        ))
+    else:
+        stderr = result.stderr.decode(errors="replace").strip()
+        rows.append((
+            "Connection Test",
+            _FAIL,
+            f"Authentication failed: {stderr}"
+        ))
+    
+    key_table = _make_status_table()
+    for row in rows:
+        key_table.add_row(*row)
+    console.print(key_table)
+    
+    # Git config is informational once the SSH checks pass, so only check it when needed
+    if fix or issues or profile or verbose:
+        _check_git_config(profile, issues)
+    else:
+        print_info("Run with --verbose to also check the Git configuration")
+    
+    if issues and fix:
+        # Fixes whose effect is re-checked afterwards; Git settings need no re-check
+        needs_verify = issues.has_ssh_fixes()
+        # Nothing has an automatic fix (e.g. only a missing SSH config)
+        if not needs_verify and not issues.git_config:
+            return issues
+        
+        print_info("\n🔧 Applying fixes...")
+        
+        # Fix permissions first; phases without prompts or child processes
+        # render their messages in a single write once the block exits
+        with console:
+            for mode, path in issues.chmod:
+                try:
+                    path.chmod(mode)
+                    print_success(f"✓ Changed permissions of {path} to {mode:o}")
+                except Exception as e:
+                    print_error(f"✗ Failed to change permissions of {path}: {e}")
+        
+        # Start SSH agent if needed
+        if issues.start_agent:
+            if get_ssh_agent().start():
+                print_success("✓ Started SSH agent")
+            else:
+                print_error("✗ Failed to start SSH agent")
+        
+        # Add key to agent
+        if issues.add_to_agent:
+            try:
+                subprocess.run(["ssh-add", issues.add_to_agent], check=True)
+                print_success("✓ Added key to SSH agent")
+            except subprocess.CalledProcessError as e:
+                print_error(f"✗ Failed to add key to agent: {e}")
+        
+        # The agent changed, so drop the cached key listing
+        if issues.start_agent or issues.add_to_agent:
+            _agent_list.cache_clear()
+        
+        # Configure Git settings
+        git_config = issues.git_config
+        if git_config:
+            print_info("\nConfiguring Git settings...")
+            
+            # Prompt for everything first, then write each target config once
+            by_profile: dict[str | None, list[tuple[str, str]]] = {}
+            for key, target in git_config.items():
+                by_profile.setdefault(target, []).append((key, prompt_git_config(key)))
+            with console:
+                for target, pairs in by_profile.items():
+                    try:
+                        set_git_config_bulk(pairs, profile=target)
+                        for key, value in pairs:
+                            print_success(f"✓ Set {key} to: {value}")
+                    except Exception as e:
+                        print_error(f"✗ Failed to set {', '.join(key for key, _ in pairs)}: {e}")
+        
+        # Regenerate keys if needed (should be last as it's most disruptive)
+        if issues.regenerate_keys:
+            print_info("\nRegenerating SSH keys...")
+            setup(clean_setup=True)
+        elif issues.update_ssh_config:
+            print_info("\nUpdating SSH config...")
+            setup(force=True)
+        
+        # Verify only the items that were just fixed
+        if needs_verify:
+            print_info("\nVerifying fixes...")
+            remaining = _verify_fixes(provider, issues, test_connection=test_connection)
+        else:
+            remaining = FixPlan()
+        # Issues without an automatic fix are still outstanding
+        remaining.create_ssh_config = issues.create_ssh_config
+        return remaining
+    
+    return issues
+
+def _verify_fixes(provider: str, plan: FixPlan, test_connection: bool = False) -> FixPlan:
+    """Re-check only the items touched by the applied fixes.
+    
+    Args:
+        provider: Provider the diagnostic was run for
+        plan: Fixes that were applied by run_diagnostic
+        test_connection: Also re-run the SSH connection test
+        
+    Returns:
+        Issues that are still present after the fixes
+    """
+    from ..ssh import test_ssh_connection
+    
+    remaining = FixPlan()
+    
+    # Re-stat only the files whose permissions were changed
+    for mode, path in plan.chmod:
+        st = _safe_stat(path)
+        if st is None:
+            print_error(f"✗ {path} no longer exists")
+            remaining.regenerate_keys = True
+        elif st.st_mode & 0o777 == mode:
+            print_success(f"✓ Permissions of {path} are {mode:o}")
+        else:
+            print_error(f"✗ Permissions of {path} are still wrong")
+            remaining.chmod.append((mode, path))
+    
+    # Query the agent only if it was started or a key was added
+    if plan.start_agent or plan.add_to_agent:
+        agent_output = _agent_list()
+        if agent_output is None:
+            print_error("✗ SSH agent is still not reachable")
+            remaining.start_agent = True
+        elif plan.add_to_agent and (
+            _key_fingerprint(plan.add_to_agent) not in _agent_fingerprints(agent_output)
+        ):
+            print_error("✗ Key is still not loaded in SSH agent")
+            remaining.add_to_agent = plan.add_to_agent
+        else:
+            print_success("✓ SSH agent is ready")
+    
+    # The handshake takes seconds, so only confirm SSH-side fixes end to end on request
+    if test_connection and plan.has_ssh_fixes():
+        test_ssh_connection(provider)
+    elif plan.has_ssh_fixes():
+        print_info("Run with --test-connection to also re-test the SSH connection")
+    
+    return remaining
+
+@lru_cache(maxsize=8)
+def get_provider_hostname(provider: str) -> str:
+    """Get the SSH hostname for a Git provider."""
+    from ..ssh import PROVIDER_HOSTNAMES
+    
+    try:
+        return PROVIDER_HOSTNAMES[provider.lower()]
+    except KeyError:
+        raise GitplexError(f"Unknown provider: {provider.lower()}") from None
+
+def prompt_git_config(param: str) -> str:
+    """Prompt user for Git configuration value."""
+    from ..ui import prompt_email, prompt_name
+    
+    # Settings with a dedicated prompt; anything else gets a generic one
+    prompt = {"user.name": prompt_name, "user.email": prompt_email}.get(param)
+    return prompt() if prompt else Prompt.ask(f"Enter value for {param}")
+
+def set_git_config(param: str, value: str, profile: str | None = None) -> None:
+    """Set Git configuration value."""
+    if profile:
+        # Set for specific profile directory
+        profile_dir = Path.home() / ".gitplex" / "profiles" / profile
+        if not profile_dir.exists():
+            raise ProfileError(f"Profile directory not found: {profile}")
+        _run_git(["config", "--file", str(profile_dir / ".gitconfig"), param, value])
+    else:
+        # Set globally
+        _run_git(["config", "--global", param, value])
+
+def set_git_config_bulk(pairs: list[tuple[str, str]], profile: str | None = None) -> None:
+    """Set several Git configuration values at once.
+    
+    The config file is written directly in a single pass when its syntax
+    allows it; otherwise each value is set with git.
+    """
+    from ..backup import _global_config_redirected, _write_gitconfig
+    
+    if profile:
+        profile_dir = Path.home() / ".gitplex" / "profiles" / profile
+        if not profile_dir.exists():
+            raise ProfileError(f"Profile directory not found: {profile}")
+        config_file: Path | None = profile_dir / ".gitconfig"
+    elif not _global_config_redirected() and (Path.home() / ".gitconfig").exists():
+        config_file = Path.home() / ".gitconfig"
+    else:
+        # Let git decide where the global config lives (e.g. XDG config)
+        config_file = None
+    if config_file and _write_gitconfig(config_file, dict(pairs)):
+        return
+    for param, value in pairs:
+        set_git_config(param, value, profile=profile)
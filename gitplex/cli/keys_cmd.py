@@ -0,0 +1,113 @@
+"""SSH key commands."""
+
+import click
+
+from ..ui_common import console, print_info, print_success
+from .common import handle_errors
+from .diagnostics import _find_ssh_key, run_diagnostic
+
+
+@click.group()
+def keys() -> None:
+    """Manage SSH keys."""
+    pass
+
+@keys.command(name="list")
+@handle_errors
+def list_keys() -> None:
+    """List all SSH keys."""
+    from rich import box
+    from rich.table import Table
+    
+    from ..backup import check_existing_configs
+    
+    # Get existing configs
+    existing_configs = check_existing_configs()
+    
+    if not existing_configs["ssh"]["exists"]:
+        print_info("No SSH keys found")
+        return
+    
+    rows = [
+        (key.name, key.key_type, key.provider, key.profile_name)
+        for key in existing_configs["ssh"]["keys"]
+    ]
+    
+    # Plain TSV when piped, so scripts don't pay for table rendering
+    if not console.is_terminal:
+        for row in rows:
+            click.echo("\t".join(row))
+        return
+    
+    # Create table for keys
+    key_table = Table(box=box.ROUNDED, show_header=True, border_style="blue")
+    key_table.add_column("Name", style="cyan")
+    key_table.add_column("Type", style="yellow")
+    key_table.add_column("Provider", style="green")
+    key_table.add_column("Profile", style="magenta")
+    
+    for row in rows:
+        key_table.add_row(*row)
+    
+    console.print("\n[bold cyan]🔑 SSH Keys[/bold cyan]")
+    console.print(key_table)
+    console.print()
+
+@keys.command()
+@click.argument("provider")
+@handle_errors
+def test(provider: str) -> None:
+    """Test SSH connection to a provider.
+
+    The SSH connection is kept open for 60 seconds so repeated tests skip the handshake.
+    """
+    from ..ssh import test_ssh_connection
+    
+    test_ssh_connection(provider)
+
+@keys.command()
+@click.argument("provider")
+@handle_errors
+def copy(provider: str) -> None:
+    """Copy SSH public key for a provider to clipboard."""
+    from ..ssh import copy_to_clipboard
+    from ..ui import print_ssh_key_info
+    
+    provider_key = _find_ssh_key(provider)
+    if not provider_key:
+        return
+    
+    # Copy key to clipboard
+    public_key = provider_key.get_public_key()
+    copy_to_clipboard(public_key)
+    
+    # Show key info
+    print_ssh_key_info(provider_key)
+
+@keys.command()
+@click.argument("provider")
+@click.option("--fix", is_flag=True, help="Automatically fix issues found")
+@click.option("--profile", help="Configure Git settings for a specific profile")
+@click.option("--verbose", is_flag=True, help="Always check Git configuration")
+@click.option("--test-connection", is_flag=True, help="Re-test the SSH connection after fixing")
+@handle_errors
+def diagnose(
+    provider: str, fix: bool, profile: str | None, verbose: bool, test_connection: bool
+) -> None:
+    """Diagnose and optionally fix SSH and Git configuration issues.
+
+    The SSH connection is kept open for 60 seconds so repeated runs skip the handshake.
+    """
+    issues = run_diagnostic(
+        provider, profile=profile, fix=fix, verbose=verbose, test_connection=test_connection
+    )
+    
+    if not fix and issues:
+        print_info("\nTo automatically fix these issues, run:")
+        print_info(f"  gitplex keys diagnose {provider} --fix" + (f" --profile {profile}" if profile else ""))
+    elif not issues:
+        print_success("\n✓ No issues found!")
+        print_info("If you're still having problems:")
+        print_info("1. Verify the key is added to your GitHub account")
+        print_info("2. Try running: ssh -vT git@github.com for verbose output")
+        print_info("3. Check GitHub's SSH troubleshooting guide: https://docs.github.com/en/authentication/troubleshooting-ssh")
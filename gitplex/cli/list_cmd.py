@@ -0,0 +1,22 @@
+"""Profile list command."""
+
+import click
+
+from ..ui_common import print_info
+from .common import _pm, handle_errors
+
+
+@click.command(name="list")
+@handle_errors
+def list_profiles() -> None:
+    """List all Git profiles."""
+    from ..ui import print_profile_table
+    
+    profiles = _pm().profiles
+
+    if not profiles:
+        print_info("No profiles found. Create one with: gitplex setup")
+        return
+
+    # Rows are read straight from the loaded profiles, without a copy
+    print_profile_table(profiles.values())
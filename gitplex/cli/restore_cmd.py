@@ -0,0 +1,27 @@
+"""Configuration restore command."""
+
+from pathlib import Path
+
+import click
+
+from ..ui_common import print_info, print_success
+from .common import handle_errors
+
+
+@click.command()
+@click.argument("backup_path", type=click.Path(exists=True))
+@click.option("--type", type=click.Choice(["git", "ssh"]), required=True)
+@handle_errors
+def restore(backup_path: str, type: str) -> None:
+    """Restore Git or SSH configuration from backup."""
+    from ..backup import restore_git_config, restore_ssh_config
+    
+    backup = Path(backup_path)
+
+    print_info(f"Restoring {type.upper()} configuration from {backup}...")
+    if type == "git":
+        restore_git_config(backup)
+    else:
+        restore_ssh_config(backup)
+
+    print_success(f"{type.upper()} configuration restored successfully")
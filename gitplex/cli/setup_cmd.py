@@ -0,0 +1,304 @@
+"""Profile setup command."""
+
+import subprocess
+from pathlib import Path
+
+import click
+from rich.prompt import Confirm
+
+from ..exceptions import GitplexError, ProfileError, SystemConfigError
+from ..ui_common import print_error, print_info, print_success, print_warning
+from .agent import ensure_ssh_agent_running
+from .common import _agent_list, _pm, handle_errors
+
+
+@click.command()
+@click.argument("name", required=False)
+@click.option("--force", is_flag=True, help="Force update existing profile")
+@click.option("--email", help="Git email address")
+@click.option("--username", help="Git username")
+@click.option(
+    "--directory",
+    type=click.Path(path_type=Path),
+    help="Workspace directory",
+)
+@click.option(
+    "--provider",
+    help="Git provider name (e.g., github, gitlab, custom-provider)",
+)
+@click.option(
+    "--non-interactive",
+    is_flag=True,
+    help="Run in non-interactive mode",
+)
+@click.option(
+    "--no-backup",
+    is_flag=True,
+    help="Skip backing up existing configurations",
+)
+@click.option(
+    "--reuse-credentials",
+    is_flag=True,
+    help="Reuse existing credentials if they match",
+    default=True,
+)
+@click.option(
+    "--clean-setup",
+    is_flag=True,
+    help="⚠️  Start fresh by removing ALL existing Git and SSH configurations",
+)
+@handle_errors
+def setup(
+    name: str | None = None,
+    force: bool = False,
+    email: str | None = None,
+    username: str | None = None,
+    directory: Path | None = None,
+    provider: str | None = None,
+    non_interactive: bool = False,
+    no_backup: bool = False,
+    reuse_credentials: bool = True,
+    clean_setup: bool = False,
+) -> None:
+    """Set up a new Git profile with Git and SSH configurations."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    from ..backup import check_existing_configs, clear_config_cache
+    from ..system import backup_configs, check_system_compatibility, clean_existing_configs
+    from ..system_utils import get_ssh_agent
+    from ..ui import (
+        print_git_config_info,
+        print_setup_steps,
+        print_welcome,
+        prompt_directory,
+        prompt_email,
+        prompt_name,
+        prompt_providers,
+        prompt_username,
+    )
+    
+    try:
+        # Without a terminal to prompt on, fail before any check or prompt runs
+        if non_interactive:
+            for label, value in (
+                ("Profile name", name),
+                ("Email", email),
+                ("Username", username),
+                ("Provider", provider),
+            ):
+                if not value:
+                    raise GitplexError(f"{label} is required in non-interactive mode")
+
+        # Print welcome message
+        if not non_interactive:
+            print_welcome()
+
+        # Scan existing configurations in the background while the system checks
+        # and agent startup (each spawning processes) run. A non-interactive run
+        # is fully specified and has nobody to show the findings to, so skip it.
+        skip_scan = clean_setup or non_interactive
+        executor = ThreadPoolExecutor(max_workers=1)
+        configs_future = None if skip_scan else executor.submit(check_existing_configs)
+        executor.shutdown(wait=False)
+
+        # Check system compatibility first
+        check_system_compatibility()
+
+        # Ensure SSH agent is running
+        ensure_ssh_agent_running()
+
+        # Finish the scan before any prompt, so none of its output lands mid-question
+        existing_configs = configs_future.result() if configs_future is not None else None
+
+        # Show existing profiles if any (nobody is there to read them in non-interactive mode)
+        existing_profiles = [] if non_interactive else _pm().list_profiles()
+        if existing_profiles:
+            print_info("\n🔍 Existing Profiles:")
+            agent = get_ssh_agent()
+            for p in existing_profiles:
+                print_info(f"\n• Profile: {p.name}")
+                print_info(f"  - Email: {p.credentials.email}")
+                print_info(f"  - Username: {p.credentials.username}")
+                print_info(f"  - Workspace: {p.workspace_dir}")
+                if hasattr(p, 'providers') and p.providers:
+                    print_info(f"  - Providers: {', '.join(p.providers.get_provider_names())}")
+                elif hasattr(p, 'provider'):
+                    print_info(f"  - Provider: {p.provider}")
+                
+                # Show SSH key info
+                if p.credentials.ssh_key:
+                    print_info(f"  - SSH Key: {p.credentials.ssh_key.private_key}")
+                    # Check if key is loaded in agent
+                    if str(p.credentials.ssh_key.private_key) in (_agent_list() or ""):
+                        print_success("    ✓ Key is loaded in SSH agent")
+                    else:
+                        print_warning("    ! Key is not loaded in SSH agent")
+                        # Offer to load the key
+                        if Confirm.ask("    Would you like to load this key into the SSH agent?"):
+                            agent.add_key(p.credentials.ssh_key.private_key)
+                            _agent_list.cache_clear()
+
+        # Scan for existing configurations
+        if existing_configs is not None:
+            print_info("\n🔍 Scanning for existing configurations...")
+            git_exists = existing_configs["git"]["exists"]
+            ssh_exists = existing_configs["ssh"]["exists"]
+            ssh_keys = existing_configs["ssh"]["keys"]
+            ssh_providers = existing_configs["ssh"]["providers"]
+            
+            # Only show existing configurations if they match the requested provider
+            if provider:
+                show_existing = provider in ssh_providers
+            else:
+                show_existing = git_exists or ssh_exists
+            
+            if show_existing:
+                print_info("\nExisting configurations found:")
+                if git_exists:
+                    print_info("• Git configuration exists")
+                if ssh_exists:
+                    print_info("• SSH configuration exists")
+                    if ssh_providers:
+                        print_info(f"  Providers: {', '.join(ssh_providers)}")
+                    
+                    # Show SSH keys detail
+                    if ssh_keys:
+                        print_info("\nSSH Keys:")
+                        keys_to_add: list[Path] = []
+                        # One agent listing serves every key below
+                        agent_output = _agent_list()
+                        for key in ssh_keys:
+                            print_info(f"  • {key.name} ({key.key_type})")
+                            # Check if key is loaded in agent
+                            if agent_output is None:
+                                print_warning("    ! Could not check SSH agent status")
+                            elif str(key.private_key) in agent_output:
+                                print_success("    ✓ Key is loaded in SSH agent")
+                            else:
+                                print_warning("    ! Key is not loaded in SSH agent")
+                                # Offer to load the key
+                                if not non_interactive and Confirm.ask(
+                                    "    Would you like to load this key into the SSH agent?"
+                                ):
+                                    keys_to_add.append(key.private_key)
+                        
+                        # Load all accepted keys with a single ssh-add call
+                        if keys_to_add:
+                            try:
+                                subprocess.run(["ssh-add", *map(str, keys_to_add)], check=True)
+                                print_success(f"✓ Loaded {len(keys_to_add)} key(s) into SSH agent")
+                            except subprocess.CalledProcessError:
+                                _agent_list.cache_clear()
+                                agent_output = _agent_list() or ""
+                                for path in keys_to_add:
+                                    if str(path) not in agent_output:
+                                        print_error(f"✗ Failed to load key: {path}")
+                            finally:
+                                _agent_list.cache_clear()
+                
+                if not force and not clean_setup:
+                    if Confirm.ask(
+                        "\nWould you like to back up your existing configurations?",
+                        default=True,
+                    ):
+                        backup_configs()
+                        print_success("Configurations backed up successfully")
+                    elif Confirm.ask(
+                        "\n⚠️  Would you like to clean up existing configurations?",
+                        default=False,
+                    ):
+                        clean_existing_configs()
+                        clear_config_cache()
+                        print_success("Existing configurations cleaned up")
+
+        # Get profile name
+        if not name:
+            name = prompt_name()
+
+        # Get email
+        if not email:
+            email = prompt_email()
+
+        # Get username
+        if not username:
+            username = prompt_username()
+
+        # Get provider
+        if not provider:
+            provider = prompt_providers()
+
+        # Get workspace directory
+        if force and name in _pm().profiles:
+            # Si estamos usando --force y el perfil existe, usar su directorio
+            directory = _pm().profiles[name].workspace_dir
+        elif not directory and not non_interactive:
+            directory = prompt_directory(name)
+        elif not directory:
+            directory = Path.home() / "Projects" / name
+
+        # Validate the provider before crear el perfil
+        try:
+            from ..providers import ProviderType
+            # Esto validará el provider y lanzará ValueError si no es válido
+            ProviderType.from_str(provider)
+        except ValueError as e:
+            raise GitplexError(str(e))
+        
+        # Create new profile
+        try:
+            profile = _pm().create_profile(
+                name=name,
+                email=email,
+                username=username,
+                provider=provider,
+                base_dir=directory.parent,  # Pass the parent directory as base_dir
+                force=force,
+                reuse_credentials=reuse_credentials,
+            )
+            
+            # New keys and config entries were written
+            clear_config_cache()
+            
+            if not non_interactive:
+                print_setup_steps()
+                print_git_config_info(profile.workspace_dir)
+            
+            if force:
+                print_success(f"Added provider '{provider}' to profile '{name}'")
+            else:
+                print_success(f"Profile '{name}' created successfully")
+            
+            print_info(
+                f"Profile '{name}' is now active. Your Git and SSH configurations "
+                "have been updated."
+            )
+        except FileNotFoundError as e:
+            if "gpg" in str(e):
+                print_warning("GPG is not installed, skipping GPG key generation")
+                profile = _pm().create_profile(
+                    name=name,
+                    email=email,
+                    username=username,
+                    provider=provider,
+                    base_dir=directory,
+                    force=force,
+                    reuse_credentials=reuse_credentials,
+                    skip_gpg=True,
+                )
+                clear_config_cache()
+                if not non_interactive:
+                    print_setup_steps()
+                    print_git_config_info(profile.workspace_dir)
+                if force:
+                    print_success(f"Added provider '{provider}' to profile '{name}'")
+                else:
+                    print_success(f"Profile '{name}' created successfully (without GPG)")
+                print_info(
+                    f"Profile '{name}' is now active. Your Git and SSH configurations "
+                    "have been updated."
+                )
+            else:
+                raise
+    
+    except (ProfileError, SystemConfigError) as e:
+        raise GitplexError(str(e))
@@ -0,0 +1,19 @@
+"""Profile switch command."""
+
+import click
+
+from ..ui_common import print_info, print_success
+from .common import _pm, handle_errors
+
+
+@click.command()
+@click.argument("name")
+@handle_errors
+def switch(name: str) -> None:
+    """Switch to a different Git profile."""
+    _pm().activate_profile(name)
+    print_success(f"Switched to profile '{name}'")
+    print_info(
+        "\nYour Git configuration has been updated. You can verify it with:\n"
+        "git config --global --list"
+    )
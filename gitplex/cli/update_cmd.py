@@ -0,0 +1,56 @@
+"""Profile update command."""
+
+import click
+
+from ..ui_common import print_error, print_success
+from .common import _pm, handle_errors
+
+
+@click.command()
+@click.argument("name")
+@click.option("--email", help="New Git email")
+@click.option("--username", help="New Git username")
+@click.option("--provider", help="Add new provider", multiple=True)
+@click.option("--remove-provider", help="Remove provider", multiple=True)
+@handle_errors
+def update(
+    name: str,
+    email: str | None = None,
+    username: str | None = None,
+    provider: tuple[str, ...] | None = None,
+    remove_provider: tuple[str, ...] | None = None,
+) -> None:
+    """Update a Git profile."""
+    if not any([email, username, provider, remove_provider]):
+        print_error("Please provide at least one of --email, --username, --provider, or --remove-provider")
+        return
+
+    profile = _pm().get_profile(name)
+    
+    if email or username:
+        # Update credentials
+        new_email = email or profile.credentials.email
+        new_username = username or profile.credentials.username
+        
+        # Check if we can reuse existing credentials
+        existing_creds = _pm().find_matching_credentials(new_email, new_username)
+        if existing_creds:
+            profile.credentials = existing_creds
+            print_success("Updated profile with existing credentials")
+        else:
+            # Create new credentials
+            profile.credentials.email = new_email
+            profile.credentials.username = new_username
+    
+    if provider:
+        # Add new providers
+        for p in profile.providers.add_providers(provider):
+            print_success(f"Added provider: {p}")
+    
+    if remove_provider:
+        # Remove providers
+        for p in profile.providers.remove_providers(remove_provider):
+            print_success(f"Removed provider: {p}")
+    
+    _pm()._save_profiles()
+    print_success(f"Profile '{name}' updated successfully")
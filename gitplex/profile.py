@@ -158,10 +158,10 @@ class ProfileManager:
                     }
                 )
         
-        # Create workspace directory
+        # Create workspace directory; an existing one is left as is
         workspace_dir = base_dir / name
-        workspace_dir.mkdir(parents=True, exist_ok=True)
-        print_success(f"Created workspace directory: {workspace_dir}")
+        os.makedirs(workspace_dir, exist_ok=True)
+        print_success(f"Workspace directory ready: {workspace_dir}")
         
         # Create or reuse credentials
         credentials = None
@@ -1,8 +1,8 @@
 """Git provider management."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List
 
 
 class ProviderType(Enum):
@@ -15,16 +15,11 @@ class ProviderType(Enum):
     @classmethod
     def from_str(cls, value: str) -> "ProviderType":
         """Convert string to provider type."""
-        mapping = {
-            "github": cls.GITHUB,
-            "gitlab": cls.GITLAB,
-            "bitbucket": cls.BITBUCKET,
-            "azure": cls.AZURE,
-        }
-        normalized = value.lower().strip()
-        if normalized not in mapping:
-            raise ValueError(f"Invalid provider: {value}")
-        return mapping[normalized]
+        # Member names are the upper-cased provider names; look them up directly
+        try:
+            return cls[value.strip().upper()]
+        except KeyError:
+            raise ValueError(f"Invalid provider: {value}") from None
 
     def __str__(self) -> str:
         """Convert provider type to string."""
@@ -82,7 +77,7 @@ class ProviderManager:
 
     def __init__(self) -> None:
         """Initialize provider manager."""
-        self.providers: List[Provider] = []
+        self.providers: list[Provider] = []
 
     def add_provider(self, provider_type: str) -> None:
         """Add a provider if not already present."""
@@ -90,16 +85,36 @@ class ProviderManager:
         if not self.has_provider(provider.type):
             self.providers.append(provider)
 
+    def add_providers(self, provider_types: Iterable[str]) -> list[str]:
+        """Add providers not already present, returning the names added."""
+        # Create them all first so an invalid name leaves the list untouched
+        providers = [Provider.create(provider_type) for provider_type in provider_types]
+        existing = {p.type for p in self.providers}
+        added = []
+        for provider in providers:
+            if provider.type not in existing:
+                existing.add(provider.type)
+                self.providers.append(provider)
+                added.append(provider.name)
+        return added
+
+    def remove_providers(self, provider_types: Iterable[str]) -> list[str]:
+        """Remove the given providers, returning the names removed."""
+        to_remove = {ProviderType.from_str(t) for t in provider_types}
+        removed = [p.name for p in self.providers if p.type in to_remove]
+        self.providers = [p for p in self.providers if p.type not in to_remove]
+        return removed
+
     def has_provider(self, provider_type: ProviderType) -> bool:
         """Check if a provider type is already added."""
         return any(p.type == provider_type for p in self.providers)
 
-    def get_provider_names(self) -> List[str]:
+    def get_provider_names(self) -> list[str]:
         """Get list of provider names."""
         return [str(p.type) for p in self.providers]
 
     @staticmethod
-    def get_available_providers() -> List[str]:
+    def get_available_providers() -> list[str]:
         """Get list of available provider names."""
         return [str(p) for p in ProviderType]
 
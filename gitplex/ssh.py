@@ -1,11 +1,12 @@
 """SSH key management module for GitPlex."""
 
 import os
-import subprocess
 import shutil
+import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Any, Union
+from typing import Any, Literal, Union
 
 from .exceptions import GitplexError
 from .ui_common import print_error, print_info, print_success, print_warning
@@ -14,6 +15,12 @@ SSHKeyType = Literal["ed25519", "rsa"]
 DEFAULT_KEY_TYPE = "ed25519"
 DEFAULT_RSA_BITS = 4096
 SSH_DIR = Path.home() / ".ssh"
+# Share one master connection between connection tests; it lingers for 60s after the last use
+SSH_MULTIPLEX_OPTS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/gitplex-cm-%C",
+    "-o", "ControlPersist=60s",
+]
 
 @dataclass
 class SSHKey:
@@ -140,15 +147,25 @@ def generate_ssh_key(
     except OSError as e:
         raise GitplexError(f"Failed to set key permissions: {e}") from e
 
+PROVIDER_HOSTNAMES = {
+    "github": "github.com",
+    "gitlab": "gitlab.com",
+    "bitbucket": "bitbucket.org",
+    "azure": "ssh.dev.azure.com",  # Azure DevOps requires ssh.dev.azure.com
+}
+HOSTNAME_PROVIDERS = {host: provider for provider, host in PROVIDER_HOSTNAMES.items()}
+# Where users register their public SSH keys with each provider
+PROVIDER_KEY_SETTINGS = {
+    "github": "https://github.com/settings/keys",
+    "gitlab": "https://gitlab.com/-/user_settings/ssh_keys",
+    "bitbucket": "https://bitbucket.org/account/settings/ssh-keys/",
+    "azure": "https://dev.azure.com/<organization>/_usersSettings/keys",
+}
+
+@lru_cache(maxsize=8)
 def get_provider_hostname(provider: str) -> str:
     """Get hostname for Git provider."""
-    hostnames = {
-        "github": "github.com",
-        "gitlab": "gitlab.com",
-        "bitbucket": "bitbucket.org",
-        "azure": "ssh.dev.azure.com",  # Azure DevOps requires ssh.dev.azure.com
-    }
-    return hostnames.get(provider.lower(), provider)
+    return PROVIDER_HOSTNAMES.get(provider.lower(), provider)
 
 def add_to_ssh_agent(key: Union[str, SSHKey]) -> None:
     """Add SSH key to SSH agent.
@@ -162,6 +179,8 @@ def add_to_ssh_agent(key: Union[str, SSHKey]) -> None:
         
         # Detect OS
         import platform
+
+        from .system_utils import parse_agent_env
         system = platform.system().lower()
         
         # First try to add the key directly
@@ -189,15 +208,8 @@ def add_to_ssh_agent(key: Union[str, SSHKey]) -> None:
             text=True
         )
         
-        # Parse SSH agent environment variables
-        env_vars = {}
-        for line in agent_output.splitlines():
-            if "=" in line:
-                name, value = line.split(";", 1)[0].split("=", 1)
-                env_vars[name.strip()] = value.strip()
-        
         # Update current environment with SSH agent variables
-        os.environ.update(env_vars)
+        os.environ.update(parse_agent_env(agent_output))
         
         # Now try to add the key again with the new environment
         try:
@@ -233,7 +245,7 @@ def test_ssh_connection(provider: str) -> bool:
     try:
         hostname = get_provider_hostname(provider)
         subprocess.run(
-            ["ssh", "-T", f"git@{hostname}"],
+            ["ssh", "-T", *SSH_MULTIPLEX_OPTS, f"git@{hostname}"],
             check=True,
             capture_output=True,
             text=True,
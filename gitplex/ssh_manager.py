@@ -1,10 +1,12 @@
 """SSH management and troubleshooting module."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
+from .system_utils import parse_agent_env
 from .ui import print_info, print_success, print_warning, print_error
 from .exceptions import SSHError
 
@@ -47,15 +49,12 @@ class SSHManager:
             )
             # Code 2 means no agent, 1 means agent with no keys, 0 means agent with keys
             if result.returncode == 2:
-                # Try to start the agent
-                subprocess.run(
-                    ["eval", "`ssh-agent -s`"],
-                    shell=True,
-                    check=True,
-                    executable="/bin/zsh"
-                )
+                # Start the agent and export its variables to this process;
+                # an eval in a subshell would lose them when the shell exits
+                agent_output = subprocess.check_output(["ssh-agent", "-s"], text=True)
+                os.environ.update(parse_agent_env(agent_output))
             return True
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
     def get_key_fingerprint(self, key_path: Path) -> Optional[str]:
@@ -235,28 +235,26 @@ def backup_configs() -> Path:
             shutil.copy2(git_config, backup_dir / "gitconfig")
             logger.debug(f"Git config backed up to {backup_dir / 'gitconfig'}")
         
-        # Backup SSH config and keys
+        # Backup SSH config, keys and known_hosts, found in a single directory read
         ssh_dir = Path.home() / ".ssh"
-        if ssh_dir.exists():
+        try:
+            with os.scandir(ssh_dir) as it:
+                ssh_files = [
+                    entry
+                    for entry in it
+                    if (entry.name in ("config", "known_hosts") or entry.name.startswith("id_"))
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            ssh_files = None
+        
+        if ssh_files is not None:
             ssh_backup_dir = backup_dir / "ssh"
             ssh_backup_dir.mkdir(parents=True, exist_ok=True)
             
-            # Backup SSH config
-            ssh_config = ssh_dir / "config"
-            if ssh_config.exists():
-                shutil.copy2(ssh_config, ssh_backup_dir / "config")
-                logger.debug(f"SSH config backed up to {ssh_backup_dir / 'config'}")
-            
-            # Backup SSH keys
-            for key_file in ssh_dir.glob("id_*"):
-                shutil.copy2(key_file, ssh_backup_dir / key_file.name)
-                logger.debug(f"SSH key {key_file.name} backed up to {ssh_backup_dir / key_file.name}")
-            
-            # Backup known_hosts
-            known_hosts = ssh_dir / "known_hosts"
-            if known_hosts.exists():
-                shutil.copy2(known_hosts, ssh_backup_dir / "known_hosts")
-                logger.debug(f"known_hosts backed up to {ssh_backup_dir / 'known_hosts'}")
+            for entry in ssh_files:
+                shutil.copy2(entry.path, ssh_backup_dir / entry.name)
+                logger.debug(f"SSH file {entry.name} backed up to {ssh_backup_dir / entry.name}")
         
         return backup_dir
         
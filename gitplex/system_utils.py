@@ -2,13 +2,21 @@
 
 import os
 import platform
+import re
 import subprocess
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional, Dict
 
 from .ui import print_error, print_info, print_success, print_warning
 
+# Matches the "VAR=value;" assignments printed by `ssh-agent -s`
+_AGENT_ENV_RE = re.compile(r"^([A-Z_]+)=([^;\n]+);", re.M)
+
+
+def parse_agent_env(output: str) -> dict[str, str]:
+    """Parse the environment variables printed by ``ssh-agent -s``."""
+    return dict(_AGENT_ENV_RE.findall(output))
+
 
 class SystemType(Enum):
     """Supported system types."""
@@ -43,10 +51,10 @@ class SSHAgentManager:
     def __init__(self) -> None:
         """Initialize SSH agent manager."""
         self.system = SystemType.detect()
-        self._env_vars: Dict[str, str] = {}
+        self._env_vars: dict[str, str] = {}
     
     @property
-    def env_vars(self) -> Dict[str, str]:
+    def env_vars(self) -> dict[str, str]:
         """Get SSH agent environment variables."""
         return self._env_vars.copy()
     
@@ -103,12 +111,9 @@ class SSHAgentManager:
             )
             
             # Parse environment variables
-            for line in agent_output.splitlines():
-                if "=" in line and ";" in line:
-                    var = line.split("=", 1)[0]
-                    value = line.split("=", 1)[1].split(";", 1)[0]
-                    os.environ[var] = value
-                    self._env_vars[var] = value
+            env = parse_agent_env(agent_output)
+            os.environ.update(env)
+            self._env_vars.update(env)
             
             return self.is_running()
         except subprocess.CalledProcessError:
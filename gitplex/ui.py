@@ -2,15 +2,13 @@
 
 import os
 import subprocess
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
 
-import git
 from rich import box
-from rich.columns import Columns
-from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
@@ -30,6 +28,36 @@ from .ui_common import (
 )
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .profile import Profile
+
+@lru_cache(maxsize=1)
+def _welcome_panel() -> Panel:
+    """Build the static welcome panel once per process."""
+    return Panel(
+        Text.assemble(
+            Text("Welcome to GitPlex! 🚀\n\n", style="bold cyan"),
+            Text("GitPlex helps you manage multiple Git identities and workspaces.\n", style="white"),
+            Text("Let's get you set up with a new Git profile.", style="white"),
+        ),
+        title="[bold cyan]Welcome[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+@lru_cache(maxsize=1)
+def _status_table() -> Table:
+    """Build the static system check table once per process."""
+    status_table = Table(box=box.ROUNDED, show_header=False, border_style="green", padding=(0, 1))
+    status_table.add_column("Check", style="dim")
+    status_table.add_column("Status", style="green")
+    
+    status_table.add_row("Git Installation", "[green]✓[/green] Git is installed")
+    status_table.add_row("SSH Installation", "[green]✓[/green] SSH is installed")
+    status_table.add_row("SSH Agent", "[green]✓[/green] SSH agent is running")
+    status_table.add_row("System Compatibility", "[green]✓[/green] System compatibility check passed")
+    return status_table
+
 def print_welcome() -> None:
     """Print welcome message and banner."""
     # Clear screen for better presentation
@@ -40,17 +68,7 @@ def print_welcome() -> None:
     console.print(f"\n[dim]Version {__version__}[/dim]")
     
     # Welcome message with improved styling
-    welcome_panel = Panel(
-        Text.assemble(
-            Text("Welcome to GitPlex! 🚀\n\n", style="bold cyan"),
-            Text("GitPlex helps you manage multiple Git identities and workspaces.\n", style="white"),
-            Text("Let's get you set up with a new Git profile.", style="white"),
-        ),
-        title="[bold cyan]Welcome[/bold cyan]",
-        border_style="cyan",
-        padding=(1, 2),
-    )
-    console.print(welcome_panel)
+    console.print(_welcome_panel())
     
     # System info in a nice table
     sys_info = Table(box=box.ROUNDED, show_header=False, border_style="blue")
@@ -62,16 +80,7 @@ def print_welcome() -> None:
     
     # Status checks with icons
     console.print("\n[bold cyan]🔍 System Check[/bold cyan]")
-    status_table = Table(box=box.ROUNDED, show_header=False, border_style="green", padding=(0, 1))
-    status_table.add_column("Check", style="dim")
-    status_table.add_column("Status", style="green")
-    
-    status_table.add_row("Git Installation", "[green]✓[/green] Git is installed")
-    status_table.add_row("SSH Installation", "[green]✓[/green] SSH is installed")
-    status_table.add_row("SSH Agent", "[green]✓[/green] SSH agent is running")
-    status_table.add_row("System Compatibility", "[green]✓[/green] System compatibility check passed")
-    
-    console.print(status_table)
+    console.print(_status_table())
     console.print()
     
     # Start process with clear next steps
@@ -273,6 +282,9 @@ def prompt_directory(default: str | None = None) -> Path:
         except Exception as e:
             print_error(f"Invalid directory: {e}")
 
+# Provider names accepted by prompt_providers, in menu order
+_PROVIDER_CHOICES = ["github", "gitlab", "bitbucket", "azure"]
+
 def prompt_providers() -> str:
     """Prompt for Git provider name with helpful hints."""
     console.print("\n[cyan]🌐 Git Provider[/cyan]")
@@ -304,13 +316,11 @@ def prompt_providers() -> str:
     
     console.print(providers_table)
     
-    valid_providers = ["github", "gitlab", "bitbucket", "azure"]
-    
     try:
         # Mostrar el prompt con el valor por defecto
         raw_input = Prompt.ask(
             "[cyan]Provider name[/cyan]",
-            choices=valid_providers,
+            choices=_PROVIDER_CHOICES,
             default="azure",  # Changed default to azure since it's more enterprise-focused
             show_default=True,
             show_choices=True
@@ -324,7 +334,7 @@ def prompt_providers() -> str:
         provider = raw_input.strip().lower()
         
         # Validar el provider
-        if provider in valid_providers:
+        if provider in _PROVIDER_CHOICES:
             return provider
         
         # Si llegamos aquí, la entrada no es válida
@@ -343,7 +353,7 @@ def prompt_providers() -> str:
         print_error(f"Error: {e}")
         return "azure"
 
-def print_profile_table(profiles: list[dict[str, Any]]) -> None:
+def print_profile_table(profiles: Iterable["Profile"]) -> None:
     """Print profiles in a table format."""
     table = Table(
         title="Git Profiles",
@@ -360,13 +370,14 @@ def print_profile_table(profiles: list[dict[str, Any]]) -> None:
     table.add_column("Active", justify="center", style="bold green")
     
     for profile in profiles:
+        providers = profile.providers.providers
         table.add_row(
-            profile["name"],
-            profile["email"],
-            profile["username"],
-            str(profile["directories"][0]),  # Show primary directory
-            profile["providers"][0],  # Show primary provider
-            "✓" if profile["active"] else ""
+            profile.name,
+            profile.credentials.email,
+            profile.credentials.username,
+            str(profile.workspace_dir),
+            str(providers[0].type) if providers else "",  # Show primary provider
+            "✓" if profile.is_active else ""
         )
     
     console.print(table)
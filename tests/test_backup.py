@@ -0,0 +1,143 @@
+"""Tests for backup and configuration helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from gitplex.backup import (
+    _parse_gitconfig,
+    _write_gitconfig,
+    check_existing_configs,
+    clear_config_cache,
+    get_git_config,
+)
+
+
+@pytest.fixture
+def gitconfig(tmp_path: Path) -> Path:
+    """Create a Git config file path."""
+    return tmp_path / ".gitconfig"
+
+
+def test_parse_gitconfig(gitconfig: Path) -> None:
+    """Test parsing a plain Git config file."""
+    gitconfig.write_text(
+        "[user]\n"
+        "\tname = Test User\n"
+        "\temail = test@example.com\n"
+        "[core]\n"
+        "\tbare\n"
+        '[remote "origin"]\n'
+        "\turl = git@github.com:test/repo.git ; trailing comment\n"
+    )
+
+    assert _parse_gitconfig(gitconfig) == {
+        "user.name": "Test User",
+        "user.email": "test@example.com",
+        "remote.origin.url": "git@github.com:test/repo.git",
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[include]\n\tpath = ~/.gitconfig.local\n",
+        '[includeIf "gitdir:~/work/"]\n\tpath = ~/.gitconfig.work\n',
+        '[user]\n\tname = "Quoted Name"\n',
+        "[user]\n  name = a\n    email = b\n",
+        "[user] name = Header Line\n",
+        "[remote \"origin\"]\n\turl = http://host/path#frag\n",
+        "[core]\n\tpager = less;cat\n",
+        "[DEFAULT]\n\tname = Default\n[user]\n\temail = test@example.com\n",
+    ],
+    ids=["include", "includeif", "quoted", "continuation", "header-entry", "hash", "semicolon", "default"],
+)
+def test_parse_gitconfig_falls_back(gitconfig: Path, content: str) -> None:
+    """Test that syntax only git can resolve is left to git."""
+    gitconfig.write_text(content)
+
+    assert _parse_gitconfig(gitconfig) is None
+
+
+def test_write_gitconfig(gitconfig: Path) -> None:
+    """Test updating and adding values in a plain Git config file."""
+    gitconfig.write_text("[user]\n    name = Old Name\n[core]\n\teditor = vim\n")
+
+    assert _write_gitconfig(
+        gitconfig,
+        {"user.name": "Test User", "user.email": "test@example.com", "init.defaultBranch": "main"},
+    )
+
+    assert gitconfig.read_text() == (
+        "[user]\n"
+        "    name = Test User\n"
+        "\temail = test@example.com\n"
+        "[core]\n"
+        "\teditor = vim\n"
+        "[init]\n"
+        "\tdefaultBranch = main\n"
+    )
+    assert _parse_gitconfig(gitconfig) == {
+        "user.name": "Test User",
+        "user.email": "test@example.com",
+        "core.editor": "vim",
+        "init.defaultbranch": "main",
+    }
+
+
+def test_write_gitconfig_falls_back(gitconfig: Path) -> None:
+    """Test that values needing quoting are left to git."""
+    gitconfig.write_text("[user]\n\tname = Test User\n")
+
+    assert not _write_gitconfig(gitconfig, {"user.name": "Name # with comment"})
+    assert gitconfig.read_text() == "[user]\n\tname = Test User\n"
+
+
+def test_check_existing_configs_keys(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only private keys with a public key are reported."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    ssh_dir = tmp_path / ".ssh"
+    ssh_dir.mkdir()
+    (ssh_dir / "id_ed25519_work_github").write_text("private")
+    (ssh_dir / "id_ed25519_work_github.pub").write_text("ssh-ed25519 AAAA work@github\n")
+    (ssh_dir / "id_rsa_orphan").write_text("private")
+    (ssh_dir / "known_hosts").write_text("")
+    clear_config_cache()
+
+    configs = check_existing_configs()
+
+    assert [key.name for key in configs["ssh"]["keys"]] == ["id_ed25519_work_github"]
+    assert configs["ssh"]["providers"] == ["github"]
+    assert configs["ssh"]["by_provider"]["github"] is configs["ssh"]["keys"][0]
+
+    # The scan stays cached, but callers get their own copy of it
+    configs["ssh"]["keys"].clear()
+    assert [key.name for key in check_existing_configs()["ssh"]["keys"]] == [
+        "id_ed25519_work_github"
+    ]
+
+
+def test_check_existing_configs_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the global Git config is read and its providers detected."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / ".gitconfig").write_text("[user]\n\tname = Test User\n[github]\n\tuser = test\n")
+    clear_config_cache()
+
+    configs = check_existing_configs()
+
+    assert configs["git"]["config"] == {"user.name": "Test User", "github.user": "test"}
+    assert configs["git"]["providers"] == ["github"]
+
+
+def test_get_git_config_honours_git_config_global(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the global config is left to git when GIT_CONFIG_GLOBAL redirects it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+    (tmp_path / ".gitconfig").write_text("")
+    alt_config = tmp_path / "alt.cfg"
+    alt_config.write_text("[user]\n\tname = Env User\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(alt_config))
+
+    assert get_git_config() == {"user.name": "Env User"}
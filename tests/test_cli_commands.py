@@ -0,0 +1,165 @@
+"""Tests for the CLI commands."""
+
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from gitplex.cli import _SUBCOMMANDS, LazyGroup, agent, cli, clone_cmd, diagnostics
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create CLI runner."""
+    return CliRunner()
+
+
+def test_help_lists_every_command(runner: CliRunner) -> None:
+    """Test that the root help lists each lazily registered command."""
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    listed = result.output.split("Commands:", 1)[1].split()
+    assert set(_SUBCOMMANDS) <= set(listed)
+
+
+@pytest.mark.parametrize("name", sorted(_SUBCOMMANDS))
+def test_lazy_subcommand_resolves(runner: CliRunner, name: str) -> None:
+    """Test that each command's module path resolves to a command of that name."""
+    group = LazyGroup(lazy_subcommands=_SUBCOMMANDS)
+
+    command = group.get_command(click.Context(group), name)
+
+    assert isinstance(command, click.Command)
+    assert command.name == name
+    assert group.get_command(click.Context(group), name) is command
+    assert runner.invoke(cli, [name, "--help"]).exit_code == 0
+
+
+@pytest.mark.parametrize("agent_ready", [True, False])
+def test_clone_configures_agent_persistence(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, agent_ready: bool
+) -> None:
+    """Test that clone persists the agent only once the provider key is loaded."""
+    calls: list[object] = []
+    monkeypatch.setattr(clone_cmd, "_find_provider_key", lambda provider: tmp_path / "id_github")
+    monkeypatch.setattr(clone_cmd, "_ensure_agent_ready", lambda key_path: agent_ready)
+    monkeypatch.setattr(
+        clone_cmd, "configure_ssh_agent_persistence", lambda: calls.append("persist")
+    )
+    monkeypatch.setattr(clone_cmd, "_run_git", lambda args, env=None: calls.append(args))
+
+    result = runner.invoke(cli, ["clone", "git@github.com:test/repo.git"])
+
+    assert result.exit_code == 0, result.output
+    expected_clone = ["clone", "git@github.com:test/repo.git"]
+    assert calls == (["persist", expected_clone] if agent_ready else [expected_clone])
+
+
+@pytest.mark.parametrize(
+    ("url", "settings_url"),
+    [
+        ("git@bitbucket.org:test/repo.git", "https://bitbucket.org/account/settings/ssh-keys/"),
+        ("git@ssh.dev.azure.com:v3/org/project/repo", "https://dev.azure.com/<organization>/"),
+    ],
+)
+def test_clone_failure_points_at_provider_key_settings(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, url: str, settings_url: str
+) -> None:
+    """Test that a failed clone links the provider's own SSH key settings."""
+    def fail(args: list[str], env: dict[str, str] | None = None) -> None:
+        raise subprocess.CalledProcessError(128, ["git", *args])
+
+    monkeypatch.setattr(clone_cmd, "_find_provider_key", lambda provider: tmp_path / "id_key")
+    monkeypatch.setattr(clone_cmd, "_ensure_agent_ready", lambda key_path: False)
+    monkeypatch.setattr(clone_cmd, "_run_git", fail)
+
+    result = runner.invoke(cli, ["clone", url])
+
+    assert result.exit_code == 1
+    assert settings_url in result.output
+    assert ".com/settings/keys" not in result.output
+
+
+@pytest.mark.parametrize("test_connection", [True, False])
+def test_verify_fixes_without_prompting(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, test_connection: bool
+) -> None:
+    """Test that fixes are re-checked without prompts, testing the connection on request."""
+    tested: list[str] = []
+    monkeypatch.setattr("gitplex.ssh.test_ssh_connection", tested.append)
+    key = tmp_path / "id_github"
+    key.write_text("private")
+    key.chmod(0o600)
+    plan = diagnostics.FixPlan(chmod=[(0o600, key), (0o644, tmp_path / "id_github.pub")])
+
+    remaining = diagnostics._verify_fixes("github", plan, test_connection=test_connection)
+
+    assert tested == (["github"] if test_connection else [])
+    assert remaining.chmod == []
+    assert remaining.regenerate_keys
+
+
+def test_verify_fixes_matches_agent_key_by_fingerprint(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a key added to the agent is recognised from its fingerprint."""
+    key = tmp_path / "id_github"
+    key.write_text("private")
+    (tmp_path / "id_github.pub").write_text("ssh-ed25519 AAAAC3NzaC1lZDI1NTE5 me@host\n")
+    fingerprint = agent._public_key_fingerprint(tmp_path / "id_github.pub")
+    listing = f"256 {fingerprint} me@host (ED25519)\n"
+    monkeypatch.setattr(diagnostics, "_agent_list", lambda: listing)
+
+    remaining = diagnostics._verify_fixes("github", diagnostics.FixPlan(add_to_agent=key))
+
+    assert not remaining
+
+
+def test_diagnostic_finds_loaded_key_by_fingerprint(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that the diagnosis doesn't flag a key the agent already holds."""
+    key = tmp_path / "id_github"
+    key.write_text("private")
+    key.chmod(0o600)
+    pub = tmp_path / "id_github.pub"
+    pub.write_text("ssh-ed25519 AAAAC3NzaC1lZDI1NTE5 me@host\n")
+    pub.chmod(0o644)
+    (tmp_path / "config").write_text(f"IdentityFile {key}\n")
+    listing = f"256 {agent._public_key_fingerprint(pub)} me@host (ED25519)\n"
+    monkeypatch.setattr("gitplex.ssh.SSH_DIR", tmp_path)
+    monkeypatch.setattr(
+        diagnostics, "_find_ssh_key", lambda provider: SimpleNamespace(private_key=key, public_key=pub)
+    )
+    monkeypatch.setattr(diagnostics, "_agent_list", lambda: listing)
+    monkeypatch.setattr(
+        diagnostics.subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 1, b"", b"successfully authenticated"),
+    )
+
+    issues = diagnostics.run_diagnostic("github")
+
+    assert not issues
+
+
+def test_non_interactive_setup_fails_before_any_check(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing required value fails before any check or prompt runs."""
+    def unexpected(*args: object, **kwargs: object) -> None:
+        raise AssertionError("setup should have failed first")
+
+    monkeypatch.setattr("gitplex.system.check_system_compatibility", unexpected)
+    monkeypatch.setattr("gitplex.backup.check_existing_configs", unexpected)
+
+    result = runner.invoke(
+        cli, ["setup", "work", "--non-interactive", "--username", "me", "--provider", "github"]
+    )
+
+    assert result.exit_code == 1
+    assert "Email is required in non-interactive mode" in result.output
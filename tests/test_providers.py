@@ -0,0 +1,40 @@
+"""Tests for provider management."""
+
+import pytest
+
+from gitplex.providers import ProviderManager
+
+
+@pytest.fixture
+def manager() -> ProviderManager:
+    """Create a provider manager holding GitHub."""
+    manager = ProviderManager()
+    manager.add_provider("github")
+    return manager
+
+
+def test_add_providers_skips_duplicates(manager: ProviderManager) -> None:
+    """Test that only providers not yet present are added, in order."""
+    added = manager.add_providers(["gitlab", "github", "GitLab", "azure"])
+
+    assert added == ["gitlab", "azure"]
+    assert manager.get_provider_names() == ["github", "gitlab", "azure"]
+
+
+def test_remove_providers_ignores_absent(manager: ProviderManager) -> None:
+    """Test that removing a provider that isn't present is a no-op."""
+    manager.add_provider("gitlab")
+
+    removed = manager.remove_providers(["bitbucket", "GITHUB"])
+
+    assert removed == ["github"]
+    assert manager.get_provider_names() == ["gitlab"]
+
+
+@pytest.mark.parametrize("method", ["add_providers", "remove_providers"])
+def test_invalid_provider_raises(manager: ProviderManager, method: str) -> None:
+    """Test that an unknown provider name raises ValueError and changes nothing."""
+    with pytest.raises(ValueError, match="Invalid provider: nope"):
+        getattr(manager, method)(["gitlab", "nope"])
+
+    assert manager.get_provider_names() == ["github"]